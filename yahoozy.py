@@ -6,18 +6,17 @@ import copy
 import curses
 import curses.panel
 import curses.textpad
+import functools
 import getpass
 import io
-import itertools
 import locale
 import os
 import random
 import sys
-from collections import UserDict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
 from pathlib import Path
-from typing import Self, TextIO
+from typing import Callable, Self, TextIO
 
 if os.name == "posix":
 	import termios
@@ -45,72 +44,117 @@ class Category(StrEnum):
 
 	def compute(self, dice: Dice) -> int:
 		"""Return the points DICE will provide in the given category."""
-		match self:
-			case Category.ONES:
-				return dice.count(1)
-			case Category.TWOS:
-				return dice.count(2) * 2
-			case Category.THREES:
-				return dice.count(3) * 3
-			case Category.FOURS:
-				return dice.count(4) * 4
-			case Category.FIVES:
-				return dice.count(5) * 5
-			case Category.SIXES:
-				return dice.count(6) * 6
-			case Category.ONE_PAIR:
-				g = (x for x in range(6, 0, -1) if dice.count(x) >= 2)
-				try:
-					return next(g) * 2
-				except StopIteration:
-					return 0
-			case Category.TWO_PAIRS:
-				g = (x for x in range(6, 0, -1) if dice.count(x) >= 2)
-				try:
-					return (next(g) + next(g)) * 2
-				except StopIteration:
-					return 0
-			case Category.TOAK:
-				g = (x for x in range(6, 0, -1) if dice.count(x) >= 3)
-				try:
-					return next(g) * 3
-				except StopIteration:
-					return 0
-			case Category.FOAK:
-				g = (x for x in range(6, 0, -1) if dice.count(x) >= 4)
-				try:
-					return next(g) * 4
-				except StopIteration:
-					return 0
-			case Category.SSTRAIGHT:
-				return 15 if set(dice) == {1, 2, 3, 4, 5} else 0
-			case Category.LSTRAIGHT:
-				return 20 if set(dice) == {2, 3, 4, 5, 6} else 0
-			case Category.FHOUSE:
-				g1 = (x for x in range(6, 0, -1) if dice.count(x) == 2)
-				g2 = (x for x in range(6, 0, -1) if dice.count(x) == 3)
-				try:
-					next(g1)
-					next(g2)
-				except StopIteration:
-					return 0
-				return sum(dice)
-			case Category.CHANCE:
-				return sum(dice)
-			case Category.YATZY:
-				return 50 if len(set(dice)) == 1 else 0
-
-
-class ScoreSheet(UserDict):
+		return _compute(self, tuple(sorted(dice)))
+
+
+# The score only depends on the multiset of dice, so by caching on the
+# sorted dice the 7776 possible rolls collapse into just 252 entries per
+# category.
+@functools.lru_cache(maxsize=4096)
+def _compute(cat: Category, dice: Dice) -> int:
+	"""Return the points the sorted DICE will provide in CAT."""
+	return _COMPUTE_FNS[cat](_histogram(dice))
+
+def _histogram(dice: Dice) -> list[int]:
+	"""Return the histogram of DICE.
+
+	Index N of the returned list holds the number of dice showing N.
+	Index 0 is unused and is always 0.
+	"""
+	# For just five dice a plain loop beats both collections.Counter and
+	# calling tuple.count() once per face.
+	counts = [0] * 7
+	for d in dice:
+		counts[d] += 1
+	return counts
+
+def _n_of_a_kind(counts: list[int], n: int) -> int:
+	"""Return the points for the highest N-of-a-kind in COUNTS."""
+	for x in range(6, 0, -1):
+		if counts[x] >= n:
+			return x * n
+	return 0
+
+def _two_pairs(counts: list[int]) -> int:
+	"""Return the points for the two highest pairs in COUNTS."""
+	pairs = [x for x in range(6, 0, -1) if counts[x] >= 2]
+	return (pairs[0] + pairs[1]) * 2 if len(pairs) >= 2 else 0
+
+def _pips(counts: list[int]) -> int:
+	"""Return the sum of the dice in COUNTS."""
+	return sum(x * n for x, n in enumerate(counts))
+
+
+# Functions computing the points for each category from a dice histogram
+_COMPUTE_FNS: dict[Category, Callable[[list[int]], int]] = {
+	Category.ONES:      lambda c: c[1],
+	Category.TWOS:      lambda c: c[2] * 2,
+	Category.THREES:    lambda c: c[3] * 3,
+	Category.FOURS:     lambda c: c[4] * 4,
+	Category.FIVES:     lambda c: c[5] * 5,
+	Category.SIXES:     lambda c: c[6] * 6,
+	Category.ONE_PAIR:  lambda c: _n_of_a_kind(c, 2),
+	Category.TWO_PAIRS: _two_pairs,
+	Category.TOAK:      lambda c: _n_of_a_kind(c, 3),
+	Category.FOAK:      lambda c: _n_of_a_kind(c, 4),
+	Category.SSTRAIGHT: lambda c: 15 if c[1:6] == [1] * 5 else 0,
+	Category.LSTRAIGHT: lambda c: 20 if c[2:7] == [1] * 5 else 0,
+	Category.FHOUSE:    lambda c: _pips(c) if 2 in c and 3 in c else 0,
+	Category.CHANCE:    _pips,
+	Category.YATZY:     lambda c: 50 if 5 in c else 0,
+}
+
+
+class ScoreSheet(dict):
+	def __init__(self) -> None:
+		# The total is cached until the next time the sheet is modified,
+		# while the upper section sum is kept up to date on every write.
+		# Only item assignment and deletion maintain these, so don’t go
+		# modifying the sheet with the other dict methods.
+		super().__init__()
+		self._total: int | None = None
+		self._upper_sum = 0
+
+	def __setitem__(self, key: Category, value: int) -> None:
+		self._total = None
+		if key in UPPER_SECTION_SET:
+			self._upper_sum += value - self.get(key, 0)
+		super().__setitem__(key, value)
+
+	def __delitem__(self, key: Category) -> None:
+		self._total = None
+		if key in UPPER_SECTION_SET:
+			self._upper_sum -= self[key]
+		super().__delitem__(key)
+
+	def __reduce__(self):
+		# Make copies and pickles rebuild the sheet through __setitem__()
+		# so that the cached sums stay correct.
+		return type(self), (), None, None, iter(self.items())
+
 	def __lt__(self, other: Self) -> bool:
 		return self.total() < other.total()
 
 	def total(self) -> int:
 		"""Return the current score."""
-		lower = sum(self.get(c, 0) for c in LOWER_SECTION)
-		upper = sum(self.get(c, 0) for c in UPPER_SECTION)
-		bonus = 50 if upper >= 63 else 0
-		return lower + upper + bonus
+		if self._total is None:
+			self._total = sum(self.values()) + bonus(self.upper())
+		return self._total
+
+	def upper(self) -> int:
+		"""Return the sum of the upper section, excluding the bonus."""
+		return self._upper_sum
+
+	def preview(self, cat: Category, points: int) -> int:
+		"""Return the score if CAT were to be scored POINTS.
+
+		This is equivalent to scoring CAT on a copy of the sheet and
+		taking its total, without the cost of actually copying it.
+		"""
+		delta = points - self.get(cat, 0)
+		upper = self.upper()
+		new_upper = upper + delta if cat in UPPER_SECTION_SET else upper
+		return self.total() + delta - bonus(upper) + bonus(new_upper)
 
 
 class Player:
@@ -126,7 +170,9 @@ class HelpPanel:
 		self._win = win.derwin(h, w, y, x)
 		self._pan = curses.panel.new_panel(self._win)
 		self._pan.top()
-		self._opts: list[str] = []
+		self._args: tuple[str, ...] = ()
+		self._opts: list[tuple[str, str, str]] = []
+		self._runs: list[tuple[str, int]] = []
 
 		# Diagnostic message
 		self.diag = ""
@@ -139,7 +185,19 @@ class HelpPanel:
 		that must be combined with the control key to execute the
 		shortcut.
 		"""
-		self._opts = sorted(args, key=self._key)
+		if args == self._args:
+			return
+		self._args = args
+		self._opts = sorted(map(self._split, args), key=lambda t: t[1])
+
+		# Lay the shortcuts row out now rather than on every draw
+		self._runs = []
+		for i, (pre, ch, post) in enumerate(self._opts):
+			if i != 0:
+				self._runs.append(("    ", 0))
+			self._runs.append((f"^{ch}  {pre}", curses.A_DIM))
+			self._runs.append((ch, curses.A_DIM | curses.A_UNDERLINE))
+			self._runs.append((post, curses.A_DIM))
 
 	def draw(self) -> None:
 		"""Draw the help panel.
@@ -152,24 +210,17 @@ class HelpPanel:
 		key and DESCRIPTION is a relevant description.  As all shortcuts
 		are mnemonic, the mnemonic letter is underlined for clarity.
 		"""
-		self._win.clear()
+		self._win.erase()
 		if self.diag != "":
-			self._win.addstr(self.diag, curses.A_DIM)
-			self._win.addch(".", curses.A_DIM)
+			self._win.addstr(self.diag + ".", curses.A_DIM)
 		self._win.move(1, 0)
-		for i, opt in enumerate(self._opts):
-			j = opt.find("*")
-			ch = self._key(opt)
-			if i != 0:
-				self._win.addstr("    ")
-			self._win.addstr(f"^{ch}  {opt[:j]}", curses.A_DIM)
-			self._win.addch(ch, curses.A_DIM | curses.A_UNDERLINE)
-			self._win.addstr(opt[j + 2:], curses.A_DIM)
+		addruns(self._win, self._runs)
 
 	@staticmethod
-	def _key(s: str) -> str:
-		"""Extract the mnemonic key from S."""
-		return s[s.find("*") + 1]
+	def _split(s: str) -> tuple[str, str, str]:
+		"""Split S into (BEFORE, KEY, AFTER) around its mnemonic KEY."""
+		pre, _, post = s.partition("*")
+		return pre, post[0], post[1:]
 
 
 class NewPlayerPanel:
@@ -219,7 +270,7 @@ class NewPlayerPanel:
 
 	def draw(self) -> None:
 		"""Draw the new player panel."""
-		self._win.clear()
+		self._win.erase()
 		self._hp.draw()
 
 		self._win.addstr(
@@ -278,13 +329,16 @@ class RenderState:
 	togl: int      # A currently active/toggled option
 	hp: HelpPanel
 
+	# The score sheet rows that can be selected when picking a category
+	can_select: list[int] = field(default_factory=list)
+
 
 class DiceState:
 	__slots__ = 'dice', 'rollmsk', 'rolls'
 
 	def __init__(self) -> None:
 		self.rolls = 2
-		self.dice = [random.randint(1, 6) for _ in range(5)]
+		self.dice = random.choices(range(1, 7), k=5)
 
 		# ROLLMSK is a 5-bit bitmask where each bit corresponds to a die
 		# in DICE.  If a die’s corresponding bit is set, it means that
@@ -293,10 +347,12 @@ class DiceState:
 
 	def reroll(self) -> None:
 		"""Reroll the dice according to the reroll mask."""
-		while self.rollmsk != 0:
-			n = self.rollmsk.bit_length() - 1
-			self.dice[n] = random.randint(1, 6)
-			self.rollmsk ^= 1 << n
+		rolls = random.choices(range(1, 7), k=self.rollmsk.bit_count())
+		for x in rolls:
+			# Pop the lowest set bit off of the mask
+			n = (self.rollmsk & -self.rollmsk).bit_length() - 1
+			self.dice[n] = x
+			self.rollmsk &= self.rollmsk - 1
 		self.rolls -= 1
 
 
@@ -313,28 +369,39 @@ BTNRR  = -5                     # ‘Reroll’ button
 BTNKA  = -6                     # ‘Keep All’ button
 BTNSC  = -7                     # ‘Select Category’ button
 
-DICE_ART = [
+# The art for each die face, already split into rows
+DICE_ART_LINES = tuple(tuple(s.split("\n")) for s in [
 	"     \n  •  \n     ",
 	" •   \n     \n   • ",
 	"   • \n  •  \n •   ",
 	" • • \n     \n • • ",
 	" • • \n  •  \n • • ",
 	" • • \n • • \n • • ",
-]
+])
+DICE_HEIGHT = len(DICE_ART_LINES[0])
+DICE_WIDTH = len(DICE_ART_LINES[0][0])
 
-UPPER_SECTION = [
+# Iterating over an enum goes through its metaclass each time, so keep
+# the categories around in a plain tuple.
+CATEGORIES = tuple(Category)
+CATEGORY_COUNT = len(CATEGORIES)
+
+UPPER_SECTION = (
 	Category.ONES,
 	Category.TWOS,
 	Category.THREES,
 	Category.FOURS,
 	Category.FIVES,
 	Category.SIXES,
-]
+)
+UPPER_SECTION_SET = frozenset(UPPER_SECTION)
+
+LOWER_SECTION = tuple(
+	c for c in CATEGORIES
+	if c not in UPPER_SECTION_SET
+)
 
-LOWER_SECTION = [
-	c for c in Category
-	if c not in UPPER_SECTION
-]
+LONGEST_CAT_NAME = max(map(len, CATEGORIES))
 
 # When the user first launches the game, there should by default already
 # be one user registered with the name matching the current login name.
@@ -345,20 +412,32 @@ def longest_length(*args: str) -> int:
 	"""Return the length of the longest string in ARGS."""
 	return max(map(len, args))
 
-def draw_top10(body_win, hist: list[LBEntry]) -> None:
-	"""Draw the all-time top 10 scores."""
+def standings() -> list[LBEntry]:
+	"""Return the scores of all players from highest to lowest."""
+	# Pull out the totals first so that sorting compares plain integers
+	# instead of going through ScoreSheet.__lt__().
+	xs = [(p.ss.total(), p.name) for p in players]
+	xs.sort(key=lambda x: x[0], reverse=True)
+	return xs
+
+def fmthist(hist: list[LBEntry]) -> list[str]:
+	"""Format the history entries HIST into leaderboard rows."""
+	return ["%3d  %s" % x for x in hist]
+
+def draw_top10(body_win, lines: list[str]) -> None:
+	"""Draw the all-time top 10 scores from the formatted LINES."""
 	TOP_10_TITLE = "All-Time Top 10"
 
 	# Compute the positions where we need to draw the leaderboard so that
 	# it’s centered.
 	y, x = body_win.getmaxyx()
-	longest = longest_length(*hist, TOP_10_TITLE)
+	longest = max((len(s) for s in lines), default=0)
+	longest = max(longest, len(TOP_10_TITLE))
 	yp, xp = y // 2 - 5, (x - longest) // 2
 
 	body_win.addstr(yp, xp, TOP_10_TITLE, curses.A_BOLD)
-	hist = ["%3d  %s" % x for x in hist]
-	for i, x in enumerate(hist, 1):
-		body_win.addstr(yp + i, xp, x)
+	for i, line in enumerate(lines, 1):
+		body_win.addstr(yp + i, xp, line)
 
 
 def main(stdscr) -> None:
@@ -369,8 +448,10 @@ def main(stdscr) -> None:
 	except FileExistsError:
 		pass
 
+	# The history only changes at the end of a game, so format it up
+	# front instead of on every redraw.
 	with histhandle("r") as fp:
-		hist = loadhist(fp, 10)
+		hist_lines = fmthist(loadhist(fp, 10))
 
 	curses.curs_set(0)
 	curses.use_default_colors()
@@ -397,38 +478,43 @@ def main(stdscr) -> None:
 	rs = RenderState(BTNAP, -1, hp)
 	npp = NewPlayerPanel(body_win)
 
+	redraw = True
 	while True:
-		body_win.clear()
+		if redraw:
+			body_win.erase()
+
+			# Draw player list
+			body_win.addstr(2, 4, "Players", curses.A_BOLD)
+			for i, p in enumerate(players):
+				if not npp.active and len(players) - rs.sel - 1 == i:
+					attr = BTNSEL
+				else:
+					attr = 0
+				body_win.addstr(3 + i, 4, "[%s]" % p.name, attr)
+			body_win.border()
 
-		# Draw player list
-		body_win.addstr(2, 4, "Players", curses.A_BOLD)
-		for i, p in enumerate(players):
-			if not npp.active and len(players) - rs.sel - 1 == i:
-				attr = BTNSEL
-			else:
-				attr = 0
-			body_win.addstr(3 + i, 4, "[%s]" % p.name, attr)
-		body_win.border()
+			draw_top10(body_win, hist_lines)
 
-		draw_top10(body_win, hist)
+			rs.hp.set_opts("*Add Player", "*Quit Program", "*Start Game")
+			rs.hp.draw()
+			if npp.active:
+				npp.draw()
 
-		rs.hp.set_opts("*Add Player", "*Quit Program", "*Start Game")
-		rs.hp.draw()
-		if npp.active:
-			npp.draw()
+			body_win.addstr(curses.LINES - 7, 5, "[Add Player]",
+			                BTNNSEL if npp.active or rs.sel != BTNAP else BTNSEL)
+			body_win.addstr(curses.LINES - 7, curses.COLS - 19, "[Start Game]",
+			                BTNNSEL if npp.active or rs.sel != BTNSG else BTNSEL)
 
-		body_win.addstr(curses.LINES - 7, 5, "[Add Player]",
-		                BTNNSEL if npp.active or rs.sel != BTNAP else BTNSEL)
-		body_win.addstr(curses.LINES - 7, curses.COLS - 19, "[Start Game]",
-		                BTNNSEL if npp.active or rs.sel != BTNSG else BTNSEL)
-
-		body_win.refresh()
+			body_win.refresh()
 
 		if npp.active:
 			npp.handle_input()
+			redraw = True
 			continue
 
+		# Only keys that actually change something warrant a redraw
 		k = body_win.get_wch()
+		redraw = True
 
 		if k == "\x01":     # ^A
 			npp.show(BTNAP)
@@ -456,7 +542,7 @@ def main(stdscr) -> None:
 			# top-10.
 			rs.sel = BTNAP
 			with histhandle("r") as fp:
-				hist = loadhist(fp, 10)
+				hist_lines = fmthist(loadhist(fp, 10))
 
 		elif k == curses.KEY_UP:
 			if rs.sel < 0 and len(players) > 0:
@@ -482,161 +568,172 @@ def main(stdscr) -> None:
 			elif rs.sel != 0:
 				rs.sel -= 1
 
+		else:
+			redraw = False
+
 
 def game_loop(rs: RenderState, body_win) -> None:
 	"""The main game-loop."""
 	ds = DiceState()
-	playergen = itertools.cycle(players)
-	player = next(playergen)
+	turn = 0
+	player = players[turn]
+
+	# The game ends once every player has scored every category
+	scored = 0
+	to_score = len(players) * CATEGORY_COUNT
 
 	rs.sel = BTNRR
 	picking_cat = False
 
-	longest_cat_name = max(map(len, Category))
+	# The leaderboard only changes when a category gets scored, so only
+	# rebuild it then.
+	leaderboard: list[str] | None = None
 
+	redraw = True
 	while True:
-		body_win.clear()
-
-		body_win.addstr(2, 4, "Current Player", curses.A_BOLD)
-		body_win.addstr("   " + player.name)
-
-		if not picking_cat:
-			body_win.addstr(3, 4, "Rolls Remaining", curses.A_BOLD)
-			body_win.addstr("  %d⁄3" % ds.rolls) # U+2044 FRACTION SLASH
-
-		# Draw the leaderboard
-		THDR = "Running Tally"
-		rt = sorted(players, key=lambda x: x.ss, reverse=True)
-		leaderboard = [f"{p.ss.total():3d}  {p.name}" for p in rt]
-		longest = max(max(map(len, leaderboard)), len(THDR))
-
-		_, x = body_win.getmaxyx()
-		x_off = x - longest - 4
-		body_win.addstr(2, x_off, THDR, curses.A_BOLD)
-		for i, line in enumerate(leaderboard, 1):
-			body_win.addstr(2 + i, x_off, line)
-
-		# Draw the score sheet.  The following code is some absolute
-		# black-magic stuff.  Straight out of Mordor.
-		xtra = 10 if picking_cat else 0
-		body_win.addstr(
-			5, 4,
-			"Score Sheet".center(longest_cat_name + 9 + xtra),
-			curses.A_BOLD,
-		)
-		for i, category in enumerate(Category):
-			s = player.ss.get(category, -1)
-			body_win.move(7 + i, 5)
-
-			if picking_cat:
-				rowattrs = (
-					BTNSEL if len(Category) - rs.sel - 1 == i
-					else curses.A_BOLD if rs.togl == i
-					else 0
-				)
+		if redraw:
+			body_win.erase()
 
-				if s == -1:
-					body_win.addstr(checkbox(rs.togl == i), rowattrs)
-				else:
-					body_win.addstr("   ", rowattrs)
-				body_win.addch(" ", rowattrs)
-			else:
-				rowattrs = 0
+			body_win.addstr(2, 4, "Current Player", curses.A_BOLD)
+			body_win.addstr("   " + player.name)
 
-			body_win.addstr(category.ljust(longest_cat_name), rowattrs)
+			if not picking_cat:
+				body_win.addstr(3, 4, "Rolls Remaining", curses.A_BOLD)
+				body_win.addstr("  %d⁄3" % ds.rolls) # U+2044 FRACTION SLASH
+
+			# Draw the leaderboard
+			THDR = "Running Tally"
+			if leaderboard is None:
+				leaderboard = ["%3d  %s" % x for x in standings()]
+				longest = max(max(map(len, leaderboard)), len(THDR))
+
+			_, x = body_win.getmaxyx()
+			x_off = x - longest - 4
+			body_win.addstr(2, x_off, THDR, curses.A_BOLD)
+			for i, line in enumerate(leaderboard, 1):
+				body_win.addstr(2 + i, x_off, line)
+
+			# Draw the score sheet.  The following code is some absolute
+			# black-magic stuff.  Straight out of Mordor.
+			xtra = 10 if picking_cat else 0
+			body_win.addstr(
+				5, 4,
+				"Score Sheet".center(LONGEST_CAT_NAME + 9 + xtra),
+				curses.A_BOLD,
+			)
+			for i, category in enumerate(CATEGORIES):
+				s = player.ss.get(category, -1)
 
-			if s == -1:
-				body_win.addstr("     —", rowattrs)
+				# The whole row shares the same attributes, so build it up
+				# and draw it in one go.
 				if picking_cat:
-					arrow = "→"
-					body_win.addstr(
-						f" {arrow} {category.compute(ds.dice):2d}",
-						rowattrs,
+					rowattrs = (
+						BTNSEL if CATEGORY_COUNT - rs.sel - 1 == i
+						else curses.A_BOLD if rs.togl == i
+						else 0
 					)
-			else:
-				body_win.addstr(f"    {s:2d}", rowattrs)
-
-		bar = "─" * (longest_cat_name + 6 + xtra)
-		body_win.addstr(6,                 5, bar)
-		body_win.addstr(len(Category) + 7, 5, bar)
-		body_win.addstr(len(Category) + 8, 5, "Total".ljust(longest_cat_name))
+					row = (checkbox(rs.togl == i) if s == -1 else "   ") + " "
+				else:
+					rowattrs = 0
+					row = ""
 
-		# Align the total with the category scores (which are now shifted
-		# over because they’re surround in button indicators).
-		if picking_cat:
-			body_win.addstr("    ")
+				row += category.ljust(LONGEST_CAT_NAME)
 
-		total = player.ss.total()
-		body_win.addstr(f"  {total:4d}")
-		if picking_cat:
-			sc = copy.deepcopy(player.ss)
-			cat = list(Category)[rs.togl]
-			sc[cat] = cat.compute(ds.dice)
-			body_win.addstr(f" {arrow} {sc.total()}")
-		curses.textpad.rectangle(
-			body_win, 4, 3,
-			9 + len(Category), 12 + longest_cat_name + xtra
-		)
+				if s == -1:
+					row += "     —"
+					if picking_cat:
+						arrow = "→"
+						row += f" {arrow} {category.compute(ds.dice):2d}"
+				else:
+					row += f"    {s:2d}"
 
-		dice_height = DICE_ART[0].count('\n') + 3
-		dice_width = len(DICE_ART[0].split('\n')[0])
-		bh, bw = body_win.getmaxyx()
-		h, w = dice_height + 3, (dice_width + 8) * 5 + 2
+				body_win.addstr(7 + i, 5, row, rowattrs)
 
-		# We don’t need the reroll buttons anymore
-		if picking_cat:
-			h -= 1
+			bar = "─" * (LONGEST_CAT_NAME + 6 + xtra)
+			body_win.addstr(6,                 5, bar)
+			body_win.addstr(CATEGORY_COUNT + 7, 5, bar)
+			row = "Total".ljust(LONGEST_CAT_NAME)
 
-		dice_win = body_win.subwin(
-			h, w,
-			bh - 12,
-			bw // 2 - w // 2,
-		)
+			# Align the total with the category scores (which are now shifted
+			# over because they’re surround in button indicators).
+			if picking_cat:
+				row += "    "
 
-		for i, d in enumerate(ds.dice):
-			lines = DICE_ART[d - 1].split('\n')
-			x_off = (dice_width + 8) * i + 3
-			for j, line in enumerate(lines):
-				dice_win.addstr(2 + j, x_off + 1, line)
-			if not picking_cat:
-				dice_win.addstr(
-					dice_height + 1, x_off - 1,
-					checkbox(ds.rollmsk & (1 << i)) + " Reroll",
-					BTNSEL if rs.sel == i else BTNNSEL,
-				)
+			total = player.ss.total()
+			row += f"  {total:4d}"
+			if picking_cat:
+				cat = CATEGORIES[rs.togl]
+				preview = player.ss.preview(cat, cat.compute(ds.dice))
+				row += f" {arrow} {preview}"
+			body_win.addstr(CATEGORY_COUNT + 8, 5, row)
 			curses.textpad.rectangle(
-				dice_win, 1, x_off,
-				len(lines) + 2, x_off + dice_width + 1,
+				body_win, 4, 3,
+				9 + CATEGORY_COUNT, 12 + LONGEST_CAT_NAME + xtra
 			)
 
-		dice_win.box()
-		dice_win.refresh()
+			bh, bw = body_win.getmaxyx()
+			h, w = DICE_HEIGHT + 5, (DICE_WIDTH + 8) * 5 + 2
 
-		if picking_cat:
-			body_win.addstr(curses.LINES - 7, bw - 22, "[Select Category]",
-			                btnattrs(rs.sel == BTNSC))
-		else:
-			body_win.addstr(curses.LINES - 7, 5, "[Reroll]",
-			                btnattrs(rs.sel == BTNRR))
-			body_win.addstr(curses.LINES - 7, bw - 15, "[Keep All]",
-			                btnattrs(rs.sel == BTNKA))
+			# We don’t need the reroll buttons anymore
+			if picking_cat:
+				h -= 1
 
-		opts = ["*Quit Program"]
-		if picking_cat:
-			opts.append("*Select Category")
-		else:
-			opts.extend([
-				"Mark *All",
-				"*Keep All",
-				"*Reroll",
-			])
-		rs.hp.set_opts(*opts)
-		rs.hp.draw()
+			dice_win = body_win.subwin(
+				h, w,
+				bh - 12,
+				bw // 2 - w // 2,
+			)
+
+			for i, d in enumerate(ds.dice):
+				lines = DICE_ART_LINES[d - 1]
+				x_off = (DICE_WIDTH + 8) * i + 3
+				for j, line in enumerate(lines):
+					dice_win.addstr(2 + j, x_off + 1, line)
+				if not picking_cat:
+					dice_win.addstr(
+						DICE_HEIGHT + 3, x_off - 1,
+						checkbox(ds.rollmsk & (1 << i)) + " Reroll",
+						BTNSEL if rs.sel == i else BTNNSEL,
+					)
+				curses.textpad.rectangle(
+					dice_win, 1, x_off,
+					DICE_HEIGHT + 2, x_off + DICE_WIDTH + 1,
+				)
 
-		body_win.box()
-		body_win.refresh()
+			dice_win.box()
+			dice_win.noutrefresh()
 
+			if picking_cat:
+				body_win.addstr(curses.LINES - 7, bw - 22, "[Select Category]",
+				                btnattrs(rs.sel == BTNSC))
+			else:
+				body_win.addstr(curses.LINES - 7, 5, "[Reroll]",
+				                btnattrs(rs.sel == BTNRR))
+				body_win.addstr(curses.LINES - 7, bw - 15, "[Keep All]",
+				                btnattrs(rs.sel == BTNKA))
+
+			opts = ["*Quit Program"]
+			if picking_cat:
+				opts.append("*Select Category")
+			else:
+				opts.extend([
+					"Mark *All",
+					"*Keep All",
+					"*Reroll",
+				])
+			rs.hp.set_opts(*opts)
+			rs.hp.draw()
+
+			# Stage both windows and then update the terminal once, so the
+			# frame is diffed against the screen and sent in a single pass
+			# instead of the dice going out half-way through drawing.
+			body_win.box()
+			body_win.noutrefresh()
+			curses.doupdate()
+
+		# Only keys that actually change something warrant a redraw
 		k = body_win.get_wch()
+		redraw = True
 		if k == "\x11":         # ^Q
 			sys.exit(0)
 
@@ -648,26 +745,25 @@ def game_loop(rs: RenderState, body_win) -> None:
 				if rs.togl == -1:
 					rs.hp.diag = "No category selected"
 				else:
-					cat = list(Category)[rs.togl]
+					cat = CATEGORIES[rs.togl]
 					player.ss[cat] = cat.compute(ds.dice)
+					leaderboard = None
+					scored += 1
 					ds = DiceState()
-					player = next(playergen)
+					turn = (turn + 1) % len(players)
+					player = players[turn]
 					picking_cat = False
 					rs.hp.diag = ""
 					rs.sel = BTNRR
 
-					if player is players[0] and len(player.ss) == len(Category):
+					if scored == to_score:
 						rs.hp.diag = ""
 						return game_end(rs, body_win)
 			elif k == "\n" and rs.sel >= 0:
-				rs.togl = len(Category) - rs.sel - 1
+				rs.togl = CATEGORY_COUNT - rs.sel - 1
 
 			elif k == curses.KEY_UP or k == curses.KEY_DOWN:
-				can_select = [
-					len(Category) - i - 1
-					for i, cat in enumerate(Category)
-					if cat not in player.ss
-				]
+				can_select = rs.can_select
 				match k:
 					case curses.KEY_UP if rs.sel == BTNSC:
 						rs.sel = can_select[-1]
@@ -685,6 +781,8 @@ def game_loop(rs: RenderState, body_win) -> None:
 					rs.sel -= 1
 				else:
 					rs.sel = BTNSC
+			else:
+				redraw = False
 		else:
 			if k == "\x01":     # ^A
 				ds.rollmsk = 0b11111
@@ -696,6 +794,14 @@ def game_loop(rs: RenderState, body_win) -> None:
 				rs.togl = -1
 				rs.hp.diag = ""
 				picking_cat = True
+
+				# The scored categories can’t change until the turn is
+				# over, so work out which rows are selectable just once.
+				rs.can_select = [
+					CATEGORY_COUNT - i - 1
+					for i, cat in enumerate(CATEGORIES)
+					if cat not in player.ss
+				]
 			elif (
 				k == "\x12"     # ^R
 				or k == "\n" and rs.sel == BTNRR
@@ -725,6 +831,8 @@ def game_loop(rs: RenderState, body_win) -> None:
 					rs.sel = BTNKA
 				elif 0 <= rs.sel < 4:
 					rs.sel += 1
+			else:
+				redraw = False
 
 
 def game_end(rs: RenderState, body_win) -> None:
@@ -745,33 +853,34 @@ def game_end(rs: RenderState, body_win) -> None:
 		savehist(fp, hist)
 
 	# Retain the first 10 entries for displaying
-	hist = hist[:10]
+	hist_lines = fmthist(hist[:10])
 
-	while True:
-		body_win.clear()
-		body_win.addstr(2, 4, "Game Over!", curses.A_BOLD)
+	body_win.erase()
+	body_win.addstr(2, 4, "Game Over!", curses.A_BOLD)
 
-		# Generate the leaderboard rows
-		FINAL_TITLE = "Final Results"
-		fr = sorted(players, key=lambda x: x.ss, reverse=True)
-		leaderboard = [f"{p.ss.total():3d}  {p.name}" for p in fr]
-		longest = longest_length(*leaderboard, FINAL_TITLE)
+	# Generate the leaderboard rows
+	FINAL_TITLE = "Final Results"
+	leaderboard = ["%3d  %s" % x for x in standings()]
+	longest = longest_length(*leaderboard, FINAL_TITLE)
 
-		# Draw the game leaderboard in the top-right
-		y, x = body_win.getmaxyx()
-		x_off = x - longest - 4
-		body_win.addstr(2, x_off, FINAL_TITLE, curses.A_BOLD)
-		for i, line in enumerate(leaderboard, 1):
-			body_win.addstr(2 + i, x_off, line)
+	# Draw the game leaderboard in the top-right
+	y, x = body_win.getmaxyx()
+	x_off = x - longest - 4
+	body_win.addstr(2, x_off, FINAL_TITLE, curses.A_BOLD)
+	for i, line in enumerate(leaderboard, 1):
+		body_win.addstr(2 + i, x_off, line)
 
-		draw_top10(body_win, hist)
+	draw_top10(body_win, hist_lines)
 
-		rs.hp.set_opts("*New Game", "*Quit Program")
-		rs.hp.draw()
+	rs.hp.set_opts("*New Game", "*Quit Program")
+	rs.hp.draw()
 
-		body_win.box()
-		body_win.refresh()
+	body_win.box()
+	body_win.refresh()
 
+	# Nothing on the end screen ever changes, so it only needs to be
+	# drawn the once.
+	while True:
 		k = body_win.get_wch()
 		if k == "\x0E":         # ^N
 			return
@@ -811,26 +920,49 @@ def histhandle(mode: str) -> TextIO:
 
 def savehist(fp: TextIO, xs: list[LBEntry]) -> None:
 	"""Save the history entries XS to the history file FP."""
-	for x in xs:
-		fp.write("%d\x1F%s\n" % x)    # 0x1F is the ASCII unit separator
+	# 0x1F is the ASCII unit separator
+	fp.write("".join("%d\x1F%s\n" % x for x in xs))
 
 def loadhist(fp: TextIO, n: int = -1) -> list[LBEntry]:
 	"""Load the first N history entries from FP.
 
 	If N is omitted this function returns all entries in FP.
 	"""
+	lines = fp.read().splitlines()
+	if n >= 0:
+		lines = lines[:n]
+
 	xs: list[LBEntry] = []
-	for i in itertools.count():
-		if i == n or (line := fp.readline()) == "":
-			break
+	for line in lines:
 		try:
-			score, name = line.rstrip("\n").split("\x1F")
+			score, name = line.split("\x1F")
 			xs.append((int(score), name))
 		except (TypeError, ValueError):
 			pass  # Corrupt entry
 	return xs
 
 
+def bonus(upper: int) -> int:
+	"""Return the bonus awarded for an upper section summing to UPPER."""
+	return 50 if upper >= 63 else 0
+
+def addruns(win, runs: list[tuple[str, int]]) -> None:
+	"""Draw RUNS of (TEXT, ATTRS) pairs to WIN at the cursor.
+
+	Adjacent runs with the same attributes are merged so that they are
+	drawn with a single call.
+	"""
+	buf: list[str] = []
+	cur = 0
+	for s, attrs in runs:
+		if attrs != cur and buf:
+			win.addstr("".join(buf), cur)
+			buf.clear()
+		buf.append(s)
+		cur = attrs
+	if buf:
+		win.addstr("".join(buf), cur)
+
 def btnattrs(ckd: bool) -> int:
 	"""Return the standard button attributes for an (un)checked button."""
 	return BTNSEL if ckd else BTNNSEL